@@ -1,32 +1,247 @@
 import os
-import re
+import math
+import time
+import base64
 import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 import httpx
+import orjson
 from fastmcp import FastMCP
 
-mcp = FastMCP("Intervals.icu MCP Proxy")
-
 ATHLETE_ID = os.getenv("INTERVALS_ATHLETE_ID", "")
 API_KEY = os.getenv(
     "INTERVALS_API_KEY", ""
 )  # from Intervals settings (Developer Settings)
-DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$")
 BASE_URL = "https://intervals.icu"
 STRAVA_BASE_URL = "https://www.strava.com/api/v3"
 STRAVA_OAUTH_URL = "https://www.strava.com/oauth/token"
+BERLIN_TZ = ZoneInfo("Europe/Berlin")
+
+EVENTS_URL = f"{BASE_URL}/api/v1/athlete/{ATHLETE_ID}/events"
+WELLNESS_URL = f"{BASE_URL}/api/v1/athlete/{ATHLETE_ID}/wellness"
+ACTIVITY_URL = BASE_URL + "/api/v1/activity/{}"
+ACTIVITY_MESSAGES_URL = BASE_URL + "/api/v1/activity/{}/messages"
+
+# Intervals.icu API: Basic Auth (username 'API_KEY', password = your API key)
+INTERVALS_AUTH_HEADER = (
+    "Basic " + base64.b64encode(f"API_KEY:{API_KEY}".encode()).decode()
+)
 
 STRAVA_CLIENT_ID = os.getenv("STRAVA_CLIENT_ID", "")
 STRAVA_CLIENT_SECRET = os.getenv("STRAVA_CLIENT_SECRET", "")
 STRAVA_ACCESS_TOKEN = os.getenv("STRAVA_ACCESS_TOKEN", "")
 STRAVA_REFRESH_TOKEN = os.getenv("STRAVA_REFRESH_TOKEN", "")
 
+# Seconds to reuse read-only date-window responses; 0 disables caching.
+CACHE_TTL = float(os.getenv("INTERVALS_CACHE_TTL", "120"))
+CACHE_MAX_ENTRIES = 128
+
+# Refresh the Strava access token this many seconds before it expires, and
+# wait this long before trying again proactively after a failed refresh.
+STRAVA_TOKEN_SKEW = 60
+STRAVA_REFRESH_BACKOFF = 300
+
+# Shared clients keep connections alive across tool calls instead of paying a
+# TCP+TLS handshake per request, and HTTP/2 lets concurrent requests to the
+# same host share one connection. They are closed in the server lifespan.
+HTTP_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# GETs answered with one of these statuses are retried with exponential
+# backoff or after Retry-After, sleeping at most HTTP_RETRY_MAX_WAIT seconds
+# in total per request. A 429 without Retry-After is not retried.
+HTTP_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_RETRY_MAX_WAIT = 10.0
+
+
+def _intervals_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={"Authorization": INTERVALS_AUTH_HEADER},
+        timeout=HTTP_TIMEOUT,
+        limits=HTTP_LIMITS,
+        http2=True,
+    )
+
+
+def _strava_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=STRAVA_BASE_URL,
+        timeout=HTTP_TIMEOUT,
+        limits=HTTP_LIMITS,
+        http2=True,
+    )
+
+
+INTERVALS_CLIENT = _intervals_client()
+STRAVA_CLIENT = _strava_client()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    # The lifespan can be entered again after a previous exit closed the
+    # clients, so replace closed ones before serving.
+    global INTERVALS_CLIENT, STRAVA_CLIENT
+    if INTERVALS_CLIENT.is_closed:
+        INTERVALS_CLIENT = _intervals_client()
+    if STRAVA_CLIENT.is_closed:
+        STRAVA_CLIENT = _strava_client()
+    try:
+        yield
+    finally:
+        await INTERVALS_CLIENT.aclose()
+        await STRAVA_CLIENT.aclose()
+
+
+mcp = FastMCP("Intervals.icu MCP Proxy", lifespan=lifespan)
+
 
 def berlin_today() -> datetime:
-    return datetime.now(ZoneInfo("Europe/Berlin"))
+    return datetime.now(BERLIN_TZ)
+
+
+async def _get(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    delay = HTTP_RETRY_BACKOFF
+    budget = HTTP_RETRY_MAX_WAIT
+    for _ in range(HTTP_RETRIES):
+        r = await client.get(url, **kwargs)
+        if r.status_code not in HTTP_RETRY_STATUSES:
+            return r
+
+        retry_after = r.headers.get("retry-after", "")
+        if retry_after.isascii() and retry_after.isdigit():
+            wait = float(retry_after)
+        elif r.status_code == 429:
+            # No hint when the limit resets (Strava uses 15-minute windows),
+            # so retrying now would only spend more quota.
+            return r
+        else:
+            wait = delay
+        if wait > budget:
+            # Not worth holding the tool call open; let the caller see it.
+            return r
+        await asyncio.sleep(wait)
+        budget -= wait
+        delay *= 2
+    return await client.get(url, **kwargs)
+
+
+def _parse(r: httpx.Response):
+    if "json" not in r.headers.get("content-type", ""):
+        return {"raw": r.text}
+    try:
+        return orjson.loads(r.content)
+    except orjson.JSONDecodeError:
+        return {"raw": r.text}
+
+
+def _is_date(s: str) -> bool:
+    # YYYY-MM-DD
+    return (
+        len(s) == 10
+        and s.isascii()
+        and s[4] == "-"
+        and s[7] == "-"
+        and s[:4].isdigit()
+        and s[5:7].isdigit()
+        and s[8:].isdigit()
+    )
+
+
+def _is_datetime(s: str) -> bool:
+    # YYYY-MM-DDTHH:MM:SS
+    return (
+        len(s) == 19
+        and s.isascii()
+        and s[10] == "T"
+        and s[13] == ":"
+        and s[16] == ":"
+        and _is_date(s[:10])
+        and s[11:13].isdigit()
+        and s[14:16].isdigit()
+        and s[17:].isdigit()
+    )
+
+
+# (tool, oldest, newest) -> (expires_at, response), oldest entries first.
+_CACHE: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+_INFLIGHT: dict[tuple, asyncio.Task] = {}
+
+
+def _store_cached(key: tuple, task: asyncio.Task) -> None:
+    if _INFLIGHT.get(key) is not task:
+        # Invalidated while in flight; its result may predate the change.
+        return
+    del _INFLIGHT[key]
+    if task.cancelled() or task.exception() is not None:
+        return
+    result = task.result()
+    if result.get("status", 500) >= 300:
+        return
+    _CACHE[key] = (time.monotonic() + CACHE_TTL, result)
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > CACHE_MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+
+
+async def _cached(key: tuple, fetch) -> dict:
+    if CACHE_TTL <= 0:
+        return await fetch()
+
+    hit = _CACHE.get(key)
+    if hit and time.monotonic() < hit[0]:
+        _CACHE.move_to_end(key)
+        return hit[1]
+
+    # Identical concurrent calls share a single in-flight request.
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda t: _store_cached(key, t))
+    return await asyncio.shield(task)
+
+
+def _invalidate_cached(tool: str) -> None:
+    for key in [k for k in _CACHE if k[0] == tool]:
+        del _CACHE[key]
+    for key in [k for k in _INFLIGHT if k[0] == tool]:
+        del _INFLIGHT[key]
+
+
+# Current Strava credentials. Strava rotates the refresh token on refresh, so
+# the latest one is kept here rather than re-read from the environment. The
+# expiry of a token seeded from the environment is unknown, so it is used
+# until Strava rejects it with a 401.
+_STRAVA_TOKEN = {
+    "access_token": STRAVA_ACCESS_TOKEN,
+    "refresh_token": STRAVA_REFRESH_TOKEN,
+    "expires_at": math.inf if STRAVA_ACCESS_TOKEN else 0.0,
+    "refresh_after": 0.0,
+    "headers": {"Authorization": "Bearer " + STRAVA_ACCESS_TOKEN},
+}
+_STRAVA_REFRESH_LOCK = asyncio.Lock()
+# Outcome of the latest refresh attempt, shared with callers that queued on
+# the lock while it ran.
+_STRAVA_REFRESH = {"generation": 0, "result": None}
+
+
+def _strava_token_stale() -> bool:
+    if not _STRAVA_TOKEN["refresh_token"]:
+        return False
+    if time.time() < _STRAVA_TOKEN["refresh_after"]:
+        # A recent refresh failed; don't retry it on every call.
+        return False
+    return (
+        not _STRAVA_TOKEN["access_token"]
+        or time.time() >= _STRAVA_TOKEN["expires_at"] - STRAVA_TOKEN_SKEW
+    )
 
 
 def _missing_strava_config() -> list[str]:
@@ -40,8 +255,9 @@ def _missing_strava_config() -> list[str]:
     return missing
 
 
-async def _refresh_strava_token(client: httpx.AsyncClient) -> dict:
-    if not STRAVA_CLIENT_ID or not STRAVA_CLIENT_SECRET or not STRAVA_REFRESH_TOKEN:
+async def _refresh_strava_token() -> dict:
+    refresh_token = _STRAVA_TOKEN["refresh_token"]
+    if not STRAVA_CLIENT_ID or not STRAVA_CLIENT_SECRET or not refresh_token:
         return {
             "error": "Missing STRAVA_CLIENT_ID/STRAVA_CLIENT_SECRET/STRAVA_REFRESH_TOKEN"
         }
@@ -49,134 +265,173 @@ async def _refresh_strava_token(client: httpx.AsyncClient) -> dict:
     payload = {
         "client_id": STRAVA_CLIENT_ID,
         "client_secret": STRAVA_CLIENT_SECRET,
-        "refresh_token": STRAVA_REFRESH_TOKEN,
+        "refresh_token": refresh_token,
         "grant_type": "refresh_token",
     }
-    r = await client.post(STRAVA_OAUTH_URL, data=payload, timeout=20.0)
-    try:
-        data = r.json()
-    except Exception:
-        data = {"raw": r.text}
+    r = await STRAVA_CLIENT.post(STRAVA_OAUTH_URL, data=payload)
+    data = _parse(r)
 
-    if r.status_code >= 400:
+    if (
+        r.status_code >= 400
+        or not isinstance(data, dict)
+        or not data.get("access_token")
+    ):
+        _STRAVA_TOKEN["refresh_after"] = time.time() + STRAVA_REFRESH_BACKOFF
         return {
             "status": r.status_code,
             "error": "Failed to refresh Strava token",
             "data": data,
         }
 
+    _STRAVA_TOKEN["access_token"] = data["access_token"]
+    _STRAVA_TOKEN["headers"] = {"Authorization": "Bearer " + data["access_token"]}
+    _STRAVA_TOKEN["refresh_token"] = data.get("refresh_token") or refresh_token
+    _STRAVA_TOKEN["expires_at"] = float(data.get("expires_at") or math.inf)
+    _STRAVA_TOKEN["refresh_after"] = 0.0
+
     return {"status": r.status_code, "data": data}
 
 
+async def _refresh_strava_token_locked(
+    generation: int, rejected_token: str | None
+) -> dict | None:
+    async with _STRAVA_REFRESH_LOCK:
+        if _STRAVA_REFRESH["generation"] != generation:
+            result = _STRAVA_REFRESH["result"]
+            return result if "error" in result else None
+        if rejected_token is None:
+            if not _strava_token_stale():
+                return None
+        elif _STRAVA_TOKEN["access_token"] != rejected_token:
+            return None
+        result = await _refresh_strava_token()
+        _STRAVA_REFRESH["generation"] += 1
+        _STRAVA_REFRESH["result"] = result
+        return result
+
+
+async def _refresh_strava_token_once(rejected_token: str | None = None) -> dict | None:
+    """
+    Refresh the Strava token unless a concurrent caller already did.
+
+    Callers that waited on the lock while another refresh ran reuse its
+    outcome, whether it succeeded or failed. Otherwise, without
+    rejected_token the token is refreshed if it is still stale once the lock
+    is held; with it, only if Strava's rejected token is still the current
+    one. Returns None when the refresh was skipped or succeeded elsewhere.
+
+    The refresh is shielded: Strava rotates the refresh token, so cancelling
+    the caller (e.g. get_activity's speculative fetch) must not abandon the
+    request before the new credentials are stored.
+    """
+    return await asyncio.shield(
+        _refresh_strava_token_locked(_STRAVA_REFRESH["generation"], rejected_token)
+    )
+
+
 async def _strava_get_activity(activity_id: str) -> dict:
     missing = _missing_strava_config()
     if missing:
         return {"error": f"Missing env vars: {', '.join(missing)}"}
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        token = STRAVA_ACCESS_TOKEN
-        refreshed = None
-
-        if not token and STRAVA_REFRESH_TOKEN:
-            refreshed = await _refresh_strava_token(client)
-            if "error" in refreshed:
-                return refreshed
-            token = refreshed.get("data", {}).get("access_token", "")
+    refreshed = None
+
+    if _strava_token_stale():
+        refreshed = await _refresh_strava_token_once()
+    if not _STRAVA_TOKEN["access_token"]:
+        return refreshed or {"error": "Failed to refresh Strava token"}
+
+    token = _STRAVA_TOKEN["access_token"]
+    headers = _STRAVA_TOKEN["headers"]
+    params = {"include_all_efforts": "true"}
+    r = await _get(
+        STRAVA_CLIENT,
+        f"/activities/{activity_id}",
+        headers=headers,
+        params=params,
+    )
 
-        headers = {"Authorization": f"Bearer {token}"}
-        params = {"include_all_efforts": "true"}
-        r = await client.get(
-            f"{STRAVA_BASE_URL}/activities/{activity_id}",
+    # Fallback for tokens revoked or expired without us knowing.
+    if r.status_code == 401 and _STRAVA_TOKEN["refresh_token"]:
+        retried = await _refresh_strava_token_once(token)
+        if retried and "error" in retried:
+            return {
+                "status": r.status_code,
+                "error": "Unauthorized from Strava",
+                "refresh": retried,
+            }
+        refreshed = retried or refreshed
+        headers = _STRAVA_TOKEN["headers"]
+        r = await _get(
+            STRAVA_CLIENT,
+            f"/activities/{activity_id}",
             headers=headers,
             params=params,
         )
 
-        if r.status_code == 401 and STRAVA_REFRESH_TOKEN:
-            refreshed = await _refresh_strava_token(client)
-            if "error" in refreshed:
-                return {
-                    "status": r.status_code,
-                    "error": "Unauthorized from Strava",
-                    "refresh": refreshed,
-                }
-            token = refreshed.get("data", {}).get("access_token", "")
-            headers = {"Authorization": f"Bearer {token}"}
-            r = await client.get(
-                f"{STRAVA_BASE_URL}/activities/{activity_id}",
+    data = _parse(r)
+
+    response = {"status": r.status_code, "data": data}
+    if r.status_code < 300:
+        stream_keys = [
+            "time",
+            "latlng",
+            "heartrate",
+            "velocity_smooth",
+            "cadence",
+            "watts",
+            "altitude",
+            "temp",
+            "grade_smooth",
+        ]
+        s_params = {"keys": ",".join(stream_keys), "key_by_type": "true"}
+        s = await _get(
+            STRAVA_CLIENT,
+            f"/activities/{activity_id}/streams",
+            headers=headers,
+            params=s_params,
+        )
+        s_data = _parse(s)
+        response["streams"] = {"status": s.status_code, "data": s_data}
+
+    if r.status_code < 300:
+        efforts = data.get("segment_efforts", []) if isinstance(data, dict) else []
+        segment_effort_ids = [
+            e.get("id") for e in efforts if isinstance(e, dict) and e.get("id")
+        ]
+        seg_keys = [
+            "time",
+            "distance",
+            "heartrate",
+            "velocity_smooth",
+            "cadence",
+            "watts",
+            "altitude",
+            "grade_smooth",
+        ]
+        seg_params = {"keys": ",".join(seg_keys), "key_by_type": "true"}
+
+        async def _fetch_segment_stream(seg_id: int) -> dict:
+            s = await _get(
+                STRAVA_CLIENT,
+                f"/segment_efforts/{seg_id}/streams",
                 headers=headers,
-                params=params,
+                params=seg_params,
             )
+            s_data = _parse(s)
+            return {"id": seg_id, "status": s.status_code, "data": s_data}
 
-        try:
-            data = r.json()
-        except Exception:
-            data = {"raw": r.text}
-
-        response = {"status": r.status_code, "data": data}
-        if r.status_code < 300:
-            stream_keys = [
-                "time",
-                "latlng",
-                "heartrate",
-                "velocity_smooth",
-                "cadence",
-                "watts",
-                "altitude",
-                "temp",
-                "grade_smooth",
-            ]
-            s_params = {"keys": ",".join(stream_keys), "key_by_type": "true"}
-            s = await client.get(
-                f"{STRAVA_BASE_URL}/activities/{activity_id}/streams",
-                headers=headers,
-                params=s_params,
-            )
-            try:
-                s_data = s.json()
-            except Exception:
-                s_data = {"raw": s.text}
-            response["streams"] = {"status": s.status_code, "data": s_data}
-
-        if r.status_code < 300:
-            efforts = data.get("segment_efforts", []) if isinstance(data, dict) else []
-            segment_effort_ids = [
-                e.get("id") for e in efforts if isinstance(e, dict) and e.get("id")
-            ]
-            seg_keys = [
-                "time",
-                "distance",
-                "heartrate",
-                "velocity_smooth",
-                "cadence",
-                "watts",
-                "altitude",
-                "grade_smooth",
-            ]
-            seg_params = {"keys": ",".join(seg_keys), "key_by_type": "true"}
-
-            async def _fetch_segment_stream(seg_id: int) -> dict:
-                s = await client.get(
-                    f"{STRAVA_BASE_URL}/segment_efforts/{seg_id}/streams",
-                    headers=headers,
-                    params=seg_params,
-                )
-                try:
-                    s_data = s.json()
-                except Exception:
-                    s_data = {"raw": s.text}
-                return {"id": seg_id, "status": s.status_code, "data": s_data}
-
-            results = await asyncio.gather(
-                *[_fetch_segment_stream(seg_id) for seg_id in segment_effort_ids]
-            )
-            response["segment_streams"] = results
-        if refreshed and "data" in refreshed:
-            response["refreshed_token"] = {
-                "access_token": refreshed["data"].get("access_token", ""),
-                "refresh_token": refreshed["data"].get("refresh_token", ""),
-                "expires_at": refreshed["data"].get("expires_at", ""),
-            }
-        return response
+        results = await asyncio.gather(
+            *[_fetch_segment_stream(seg_id) for seg_id in segment_effort_ids]
+        )
+        response["segment_streams"] = results
+    if refreshed and "error" not in refreshed:
+        response["refreshed_token"] = {
+            "access_token": refreshed["data"].get("access_token", ""),
+            "refresh_token": refreshed["data"].get("refresh_token", ""),
+            "expires_at": refreshed["data"].get("expires_at", ""),
+        }
+    return response
 
 
 @mcp.tool
@@ -190,22 +445,13 @@ async def get_last4w_events() -> dict:
     newest = berlin_today().date()
     oldest = newest - timedelta(days=28)
 
-    url = f"{BASE_URL}/api/v1/athlete/{ATHLETE_ID}/events"
     params = {"oldest": oldest.isoformat(), "newest": newest.isoformat()}
 
-    # Intervals.icu API: Basic Auth (username 'API_KEY', password = your API key)
-    # Source: Intervals.icu forum API guide.
-    auth = ("API_KEY", API_KEY)  # :contentReference[oaicite:2]{index=2}
-
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        r = await client.get(url, params=params, auth=auth)
-        try:
-            data = r.json()
-        except Exception:
-            data = {"raw": r.text}
+    r = await _get(INTERVALS_CLIENT, EVENTS_URL, params=params)
+    data = _parse(r)
 
     return {
-        "request": {"url": url, "params": params, "status": r.status_code},
+        "request": {"url": EVENTS_URL, "params": params, "status": r.status_code},
         "data": data,
     }
 
@@ -218,21 +464,17 @@ async def get_events(oldest: str, newest: str) -> dict:
     if not API_KEY:
         return {"error": "Missing INTERVALS_API_KEY env var"}
 
-    if not DATE_RE.match(oldest) or not DATE_RE.match(newest):
+    if not _is_date(oldest) or not _is_date(newest):
         return {"error": "Dates must be in YYYY-MM-DD format"}
 
-    url = f"{BASE_URL}/api/v1/athlete/{ATHLETE_ID}/events"
     params = {"oldest": oldest, "newest": newest}
-    auth = ("API_KEY", API_KEY)
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        r = await client.get(url, params=params, auth=auth)
-        try:
-            data = r.json()
-        except Exception:
-            data = {"raw": r.text}
+    async def _fetch() -> dict:
+        r = await _get(INTERVALS_CLIENT, EVENTS_URL, params=params)
+        data = _parse(r)
+        return {"status": r.status_code, "request": {"params": params}, "data": data}
 
-    return {"status": r.status_code, "request": {"params": params}, "data": data}
+    return await _cached(("get_events", oldest, newest), _fetch)
 
 
 @mcp.tool
@@ -262,7 +504,7 @@ async def create_event(
     if not API_KEY:
         return {"error": "Missing INTERVALS_API_KEY env var"}
 
-    if not DATETIME_RE.match(start_date_local):
+    if not _is_datetime(start_date_local):
         return {"error": "start_date_local must be YYYY-MM-DDTHH:MM:SS"}
 
     payload = {
@@ -273,21 +515,15 @@ async def create_event(
         "description": description,
     }
 
-    url = f"{BASE_URL}/api/v1/athlete/{ATHLETE_ID}/events"
-
-    # Personal API key: Basic Auth (username 'API_KEY', password = API key)
-    auth = ("API_KEY", API_KEY)
+    r = await INTERVALS_CLIENT.post(EVENTS_URL, json=payload)
+    data = _parse(r)
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        r = await client.post(url, auth=auth, json=payload)
-        try:
-            data = r.json()
-        except Exception:
-            data = {"raw": r.text}
+    if r.status_code < 300:
+        _invalidate_cached("get_events")
 
     return {
         "status": r.status_code,
-        "request": {"url": url, "payload": payload},
+        "request": {"url": EVENTS_URL, "payload": payload},
         "data": data,
     }
 
@@ -300,21 +536,17 @@ async def get_wellness_records(oldest: str, newest: str) -> dict:
     if not API_KEY:
         return {"error": "Missing INTERVALS_API_KEY env var"}
 
-    if not DATE_RE.match(oldest) or not DATE_RE.match(newest):
+    if not _is_date(oldest) or not _is_date(newest):
         return {"error": "Dates must be in YYYY-MM-DD format"}
 
-    url = f"{BASE_URL}/api/v1/athlete/{ATHLETE_ID}/wellness"
     params = {"oldest": oldest, "newest": newest}
-    auth = ("API_KEY", API_KEY)
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        r = await client.get(url, params=params, auth=auth)
-        try:
-            data = r.json()
-        except Exception:
-            data = {"raw": r.text}
+    async def _fetch() -> dict:
+        r = await _get(INTERVALS_CLIENT, WELLNESS_URL, params=params)
+        data = _parse(r)
+        return {"status": r.status_code, "request": {"params": params}, "data": data}
 
-    return {"status": r.status_code, "request": {"params": params}, "data": data}
+    return await _cached(("get_wellness_records", oldest, newest), _fetch)
 
 
 @mcp.tool
@@ -326,24 +558,34 @@ async def get_activity(activity_id: str) -> dict:
     if not API_KEY:
         return {"error": "Missing INTERVALS_API_KEY env var"}
 
-    url = f"{BASE_URL}/api/v1/activity/{activity_id}"
-    auth = ("API_KEY", API_KEY)
+    # Strava-sourced activities keep their numeric Strava ID in Intervals, so
+    # for those we start the Strava fetch alongside the Intervals request
+    # instead of waiting for the Intervals stub first.
+    strava_task = None
+    if activity_id.isdigit() and not _missing_strava_config():
+        strava_task = asyncio.create_task(_strava_get_activity(activity_id))
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        r = await client.get(url, auth=auth)
-        try:
-            data = r.json()
-        except Exception:
-            data = {"raw": r.text}
+    try:
+        r = await _get(INTERVALS_CLIENT, ACTIVITY_URL.format(activity_id))
+    except BaseException:
+        if strava_task:
+            strava_task.cancel()
+        raise
+    data = _parse(r)
 
     if (
         isinstance(data, dict)
         and data.get("source") == "STRAVA"
         and data.get("_note") == "STRAVA activities are not available via the API"
     ):
-        strava = await _strava_get_activity(activity_id)
+        if strava_task:
+            strava = await strava_task
+        else:
+            strava = await _strava_get_activity(activity_id)
         return {"status": r.status_code, "data": data, "strava": strava}
 
+    if strava_task:
+        strava_task.cancel()
     return {"status": r.status_code, "data": data}
 
 
@@ -359,20 +601,21 @@ async def get_activity_comments(activity_id: str) -> dict:
     if not API_KEY:
         return {"error": "Missing INTERVALS_API_KEY env var"}
 
-    url = f"{BASE_URL}/api/v1/activity/{activity_id}/messages"
-    auth = ("API_KEY", API_KEY)
-
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        r = await client.get(url, auth=auth)
-        try:
-            data = r.json()
-        except Exception:
-            data = {"raw": r.text}
+    r = await _get(INTERVALS_CLIENT, ACTIVITY_MESSAGES_URL.format(activity_id))
+    data = _parse(r)
 
     return {"status": r.status_code, "data": data}
 
 
 if __name__ == "__main__":
+    # libuv-based event loop; not available on Windows.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Streamable HTTP endpoint at /mcp
     mcp.run(
         transport="http",